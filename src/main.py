@@ -1,20 +1,26 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from json import loads, dumps, JSONDecodeError
-from os import getuid, getgid
+from os import getuid, getgid, stat
 from os.path import abspath, dirname, pardir
 from os.path import join as os_join
 from platform import machine
+from re import compile as re_compile
 from shlex import quote as shlex_quote
-from subprocess import run, CompletedProcess, PIPE, STDOUT
-from sys import exit, argv
-from threading import Thread
+from shutil import which
+from subprocess import run, CompletedProcess, DEVNULL, PIPE, STDOUT
+from sys import exit, argv, stdin
+from threading import Timer
+from time import monotonic
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
 
+@lru_cache(maxsize=None)  # noqa: UP033 (functools.cache needs Python >= 3.9)
 def script_dir() -> str:
     """
     Returns the directory of this script as absolute path
@@ -24,6 +30,7 @@ def script_dir() -> str:
     return dirname(abspath(__file__))
 
 
+@lru_cache(maxsize=None)  # noqa: UP033 (functools.cache needs Python >= 3.9)
 def repo_base_dir() -> str:
     """
     Returns the base directory of this git repository as absolute path
@@ -39,35 +46,33 @@ class Colors:
     """
 
     @staticmethod
-    def concat_str(*args: Any) -> str:
-        """
-        Concatenates objects via the str() function on every object to return a string
-
-        :param args:    The arguments to concatenate
-        :return:        The concatenated objects as string
-        """
-        return "".join([str(arg) for arg in args])
+    def red(*x: Any) -> str: return f"\033[31m{''.join(map(str, x))}\033[39m"
 
     @staticmethod
-    def red(*x: Any) -> str: return Colors.concat_str("\033[31m", *x, "\033[39m")
+    def cyan(*x: Any) -> str: return f"\033[36m{''.join(map(str, x))}\033[39m"
 
     @staticmethod
-    def cyan(*x: Any) -> str: return Colors.concat_str("\033[36m", *x, "\033[39m")
+    def light_green(*x: Any) -> str: return f"\033[92m{''.join(map(str, x))}\033[39m"
 
     @staticmethod
-    def light_green(*x: Any) -> str: return Colors.concat_str("\033[92m", *x, "\033[39m")
+    def light_yellow(*x: Any) -> str: return f"\033[93m{''.join(map(str, x))}\033[39m"
 
     @staticmethod
-    def light_yellow(*x: Any) -> str: return Colors.concat_str("\033[93m", *x, "\033[39m")
+    def light_magenta(*x: Any) -> str: return f"\033[95m{''.join(map(str, x))}\033[39m"
 
     @staticmethod
-    def light_magenta(*x: Any) -> str: return Colors.concat_str("\033[95m", *x, "\033[39m")
+    def light_cyan(*x: Any) -> str: return f"\033[96m{''.join(map(str, x))}\033[39m"
 
     @staticmethod
-    def light_cyan(*x: Any) -> str: return Colors.concat_str("\033[96m", *x, "\033[39m")
+    def bold(*x: Any) -> str: return f"\033[1m{''.join(map(str, x))}\033[22m"
 
-    @staticmethod
-    def bold(*x: Any) -> str: return Colors.concat_str("\033[1m", *x, "\033[22m")
+
+# The colored beginnings of the podman messages, which never change
+_STATUS_PREFIX = Colors.light_green("~~")
+_ERROR_PREFIX = Colors.red("!!")
+_NOTE_PREFIX = Colors.light_cyan("::")
+_QUESTION_PREFIX = Colors.light_yellow("??")
+_INPUT_PREFIX = Colors.light_magenta("++")
 
 
 def print_and_input(input_message: str, *prints_before_input: str):
@@ -76,20 +81,19 @@ def print_and_input(input_message: str, *prints_before_input: str):
     input(input_message)
 
 
-def podman_message(string: str, new_line: bool, to_print: bool, color: Any, string_begin: str) -> str:
+def podman_message(string: str, new_line: bool, to_print: bool, prefix: str) -> str:
     """
-    Generates a podman message of the following form: "color(string_begin) string"
+    Generates a podman message of the following form: "prefix string"
 
-    :param string:          The string for the message
-    :param new_line:        Whether to start the message with a newline or not
-    :param to_print:        If the generated message should be printed
-    :param color:           The color of the Colors class to be used
-    :param string_begin:    The string to be colored with the color parameter at the beginning of the message
-    :return:                The generated message
+    :param string:      The string for the message
+    :param new_line:    Whether to start the message with a newline or not
+    :param to_print:    If the generated message should be printed
+    :param prefix:      The already colored string at the beginning of the message
+    :return:            The generated message
     """
-    to_return = "\n" if new_line else ""
+    line_begin = "\n" if new_line else ""
 
-    to_return += f"{color(string_begin)} {string}"
+    to_return = f"{line_begin}{prefix} {string}"
 
     if to_print:
         print(to_return)
@@ -106,7 +110,7 @@ def podman_status(string: str, new_line: bool = False, to_print: bool = True) ->
     :param to_print:    If the generated status should be printed
     :return:            The generated status
     """
-    return podman_message(string, new_line, to_print, Colors.light_green, "~~")
+    return podman_message(string, new_line, to_print, _STATUS_PREFIX)
 
 
 def podman_error(string: str, new_line: bool = False, to_print: bool = True) -> str:
@@ -118,7 +122,7 @@ def podman_error(string: str, new_line: bool = False, to_print: bool = True) ->
     :param to_print:    If the generated error should be printed
     :return:            The generated error
     """
-    return podman_message(string, new_line, to_print, Colors.red, "!!")
+    return podman_message(string, new_line, to_print, _ERROR_PREFIX)
 
 
 def podman_note(string: str, new_line: bool = False, to_print: bool = True) -> str:
@@ -130,7 +134,7 @@ def podman_note(string: str, new_line: bool = False, to_print: bool = True) -> s
     :param to_print:    If the generated note should be printed
     :return:            The generated note
     """
-    return podman_message(string, new_line, to_print, Colors.light_cyan, "::")
+    return podman_message(string, new_line, to_print, _NOTE_PREFIX)
 
 
 def podman_question(string: str, new_line: bool = False, to_print: bool = True) -> str:
@@ -142,7 +146,7 @@ def podman_question(string: str, new_line: bool = False, to_print: bool = True)
     :param to_print:    If the generated question should be printed
     :return:            The generated question
     """
-    return podman_message(string, new_line, to_print, Colors.light_yellow, "??")
+    return podman_message(string, new_line, to_print, _QUESTION_PREFIX)
 
 
 def podman_input(string: str, new_line: bool = False) -> str:
@@ -153,14 +157,72 @@ def podman_input(string: str, new_line: bool = False) -> str:
     :param new_line:    Whether to start the input message with a newline or not
     :return:            The generated input message
     """
-    return podman_message(string, new_line, False, Colors.light_magenta, "++")
+    return podman_message(string, new_line, False, _INPUT_PREFIX)
+
+
+# The valid answers for input_yes_or_no
+_YES_OR_NO = frozenset(("y", "n"))
+
+
+def input_yes_or_no(max_attempts: int | None = None, last_prompt: str | None = None) -> str:
+    """
+    Asks the user for yes or no until a valid answer is given
+    Only the first character of the answer counts, so e.g. "yes" and "No" are valid answers too
+
+    :param max_attempts:    The maximum number of times to ask, None to ask until a valid answer is given
+                            If no valid answer is given within that many attempts, the answer is no
+    :param last_prompt:     The prompt for the last of max_attempts, e.g. to tell that anything else means no
+                            None to use the same prompt as for the other attempts
+    :return:                "y" for yes and "n" for no
+    """
+    attempts = 0
+    while max_attempts is None or attempts < max_attempts:
+        if last_prompt is not None and attempts == max_attempts - 1:
+            prompt = last_prompt
+        else:
+            prompt = "Enter y for yes and n for no: "
+
+        choice = input(podman_input(prompt)).strip()[:1].lower()
+        if choice in _YES_OR_NO:
+            return choice
+        attempts += 1
+
+    return "n"
+
+
+def command_as_str(command: str | Sequence[str]) -> str:
+    """
+    Returns a command as it would be entered in the shell
+
+    :param command: The command, either as string or as sequence of arguments
+    :return:        The command as string
+    """
+    if isinstance(command, str):
+        return command
+
+    return " ".join(shlex_quote(argument) for argument in command)
+
+
+def format_command(command: Sequence[str], *args: str) -> tuple[str, ...]:
+    """
+    Fills the placeholders of a command given as sequence of arguments
+    Every argument being exactly "{}" is a placeholder and replaced by the next of the given values
+
+    :param command: The command containing placeholders
+    :param args:    The values for the placeholders in order
+    :return:        The command with filled placeholders
+    """
+    values = iter(args)
+    return tuple(next(values) if argument == "{}" else argument for argument in command)
 
 
 def run_command(
-        command: str, capture_output: bool = False, valid_return_codes: Sequence[int] | None = None,
+        command: str | Sequence[str], capture_output: bool = False, valid_return_codes: Sequence[int] | None = None,
+        discard_output: bool = False,
 ) -> CompletedProcess:
     """
-    Runs a given command in the shell, and may additionally check for valid return codes
+    Runs a given command, and may additionally check for valid return codes
+    Commands given as string are run in the shell, commands given as sequence of arguments are run without a shell
 
     :param command:             The command to run
     :param capture_output:      Set to True, if you want to suppress the output of the command but instead capture it
@@ -168,67 +230,100 @@ def run_command(
                                 STDOUT and STDERR are going to be combined into STDOUT if you specify True
     :param valid_return_codes:  If you want to raise a RuntimeError in case of an invalid return code,
                                 provide a sequence of valid return codes to be checked against
+    :param discard_output:      Set to True, if you want to suppress the output of the command without capturing it
+                                Use this instead of capture_output, if only the return code is of interest
     :return:                    The subprocess.CompletedProcess object of the call
                                 See https://docs.python.org/3/library/subprocess.html#subprocess.CompletedProcess
     """
-    if capture_output:
-        completed = run(command, shell=True, text=True, check=False, stdout=PIPE, stderr=STDOUT)
+    shell = isinstance(command, str)
+
+    if discard_output:
+        completed = run(command, shell=shell, check=False, stdout=DEVNULL, stderr=DEVNULL)
+    elif capture_output:
+        completed = run(command, shell=shell, text=True, check=False, stdout=PIPE, stderr=STDOUT)
     else:
-        completed = run(command, shell=True, text=True, check=False)
+        completed = run(command, shell=shell, text=True, check=False)
 
     if valid_return_codes and completed.returncode not in valid_return_codes:
-        if capture_output:
-            podman_error(f"'{command}' could not be executed correctly:\n   {completed.stdout.strip()}", new_line=True)
+        if capture_output and not discard_output:
+            podman_error(
+                f"'{command_as_str(command)}' could not be executed correctly:\n   {completed.stdout.strip()}",
+                new_line=True,
+            )
         else:
-            podman_error(f"'{command}' could not be executed correctly", new_line=True)
+            podman_error(f"'{command_as_str(command)}' could not be executed correctly", new_line=True)
 
         raise RuntimeError
 
     return completed
 
 
+def run_probe(command: str | Sequence[str]) -> CompletedProcess:
+    """
+    Runs a command that only checks something, capturing its output like run_command(command, True)
+    Unlike run_command, file descriptors are not closed in the child and the executable is given as absolute path,
+    which allows Python (>= 3.8) to start the command via posix_spawn() instead of fork() and exec()
+    See: https://docs.python.org/3/library/subprocess.html#popen-constructor
+    Only meant for our trusted status checks, which are called on every iteration of the menu
+
+    :param command: The command to run, see run_command
+    :return:        The subprocess.CompletedProcess object of the call
+    """
+    shell = isinstance(command, str)
+    if not shell:
+        command = (which(command[0]) or command[0], *command[1:])
+
+    return run(command, shell=shell, text=True, check=False, stdout=PIPE, stderr=STDOUT, close_fds=False)
+
+
 class Calls:
     """
     Contains various commands to be used to handle our Podman Image and Container
+    Commands given as tuples are executed directly, commands given as strings are executed in the shell
     """
+    # See: https://www.sudo.ws/docs/man/sudo.man/
+    # `sudo --list` shows the Defaults entries matching our user, including Defaults:user and Defaults:%group
+    sudoListDefaults = ("sudo", "--non-interactive", "--list")
+    # `sudo -V` executed as root also prints the built-in defaults, LC_ALL=C keeps their descriptions untranslated
+    sudoVersionDefaults = ("sudo", "--non-interactive", "env", "LC_ALL=C", "sudo", "-V")
+
     # See: https://man7.org/linux/man-pages/man8/findmnt.8.html
-    mountInfoArgs = "sudo findmnt --json --all --target {}"
+    mountInfoArgs = ("sudo", "findmnt", "--json", "--all", "--target", "{}")
 
     # See: http://docs.podman.io/en/latest/markdown/podman-info.1.html
     # Calling `podman info` twice, because the first call may fail after changing/removing the graphRoot folder
     podmanInfo = "sudo podman info >/dev/null 2>&1; sudo podman info --format=json"
-
-    # See: http://docs.podman.io/en/latest/markdown/podman.1.html#root-value
-    podmanRoot = loads(run_command(podmanInfo, True, valid_return_codes=(0,)).stdout)["store"]["graphRoot"].strip()
+    # Calling `podman info` once, which is enough if the graphRoot folder did not change
+    podmanInfoOnce = ("sudo", "podman", "info", "--format=json")
 
     # See: http://docs.podman.io/en/latest/markdown/podman-system-reset.1.html
-    podmanReset = "sudo podman system reset --force"
-
-    # See: http://docs.podman.io/en/latest/markdown/podman-system-prune.1.html
-    pruneSystem = "sudo podman system prune --force"
-
-    # See: http://docs.podman.io/en/latest/markdown/podman-image-prune.1.html
-    pruneImage = "sudo podman image prune --force"
+    podmanReset = ("sudo", "podman", "system", "reset", "--force")
 
+    # Removing our image or container and pruning afterwards in a single call
     # See: http://docs.podman.io/en/latest/markdown/podman-rmi.1.html
-    rmAUVImage = "sudo podman image rm --force auv"
-
     # See: http://docs.podman.io/en/latest/markdown/podman-rm.1.html
-    rmAUVContainer = "sudo podman container rm --force auv"
+    # See: http://docs.podman.io/en/latest/markdown/podman-system-prune.1.html
+    # `podman system prune` also removes dangling images, so there is no need to call `podman image prune` in addition
+    # Return codes of `podman rm` and `podman image rm`: 1 means there is no such container or image,
+    # 2 means it is in use (a running or paused container, an image used by a container or having children)
+    # The helpers always accepted both, so we still prune in these cases
+    clearAUVImage = ("sudo", "sh", "-c", "podman image rm --force auv; [ $? -le 2 ] && podman system prune --force")
+    clearAUVContainer = ("sudo", "sh", "-c",
+                         "podman container rm --force auv; [ $? -le 2 ] && podman system prune --force")
 
     # See: http://docs.podman.io/en/latest/markdown/podman-save.1.html
-    saveImageArgs = "sudo podman save --output {} auv:latest"
+    saveImageArgs = ("sudo", "podman", "save", "--output", "{}", "auv:latest")
 
     # See: http://docs.podman.io/en/latest/markdown/podman-load.1.html
-    loadImageArgs = "sudo podman load --input {}"
+    loadImageArgs = ("sudo", "podman", "load", "--input", "{}")
 
     # See: https://www.freedesktop.org/software/systemd/man/systemctl.html
-    systemdEnable = "sudo systemctl enable container-auv.service"
-    systemdDisable = "sudo systemctl disable container-auv.service"
-    systemdStarted = "sudo systemctl is-active container-auv.service"
-    systemdStart = "sudo systemctl start container-auv.service"
-    systemdStop = "sudo systemctl stop container-auv.service"
-    systemdReload = "sudo systemctl daemon-reload"
+    systemdEnable = ("sudo", "systemctl", "enable", "container-auv.service")
+    systemdDisable = ("sudo", "systemctl", "disable", "container-auv.service")
+    systemdStarted = ("sudo", "systemctl", "is-active", "container-auv.service")
+    systemdStart = ("sudo", "systemctl", "start", "container-auv.service")
+    systemdStop = ("sudo", "systemctl", "stop", "container-auv.service")
+    systemdReload = ("sudo", "systemctl", "daemon-reload")
 
     # See: http://docs.podman.io/en/latest/markdown/podman-generate-systemd.1.html
     serviceFilePath = "/etc/systemd/system/container-auv.service"
@@ -236,18 +331,30 @@ class Calls:
                     f"sudo tee {serviceFilePath} > /dev/null"
 
     # See: http://docs.podman.io/en/latest/markdown/podman-inspect.1.html
-    containerRunning = "sudo podman container inspect auv"
+    containerRunning = ("sudo", "podman", "container", "inspect", "auv")
+
+    # systemdStarted and containerRunning in a single call, printing the return code of each in its own line
+    combinedStatus = ("sudo", "sh", "-c", "systemctl is-active --quiet container-auv.service; echo $?; "
+                      "podman container inspect auv >/dev/null 2>&1; echo $?")
 
     # See: https://wiki.archlinux.org/index.php/Xhost
     xhostFilePath = "/etc/profile.d/xhost.sh"
     xhostEnableStart = "sudo cp --force {} {} && sudo chmod 555 {} && . {}" \
                        "".format(os_join(script_dir(), "xhost.sh"), xhostFilePath, xhostFilePath, xhostFilePath)
-    xhostDisableStop = f"sudo rm --force {xhostFilePath}"
+    xhostDisableStop = ("sudo", "rm", "--force", xhostFilePath)
 
-    # See: http://docs.podman.io/en/latest/markdown/podman-build.1.html
-    buildImage = f"sudo TMPDIR={podmanRoot} podman build --force-rm --no-cache --pull=always --tag auv:latest " \
-                 f"--build-arg UID={getuid()} --build-arg GID={getgid()} --build-arg DISPLAY=$DISPLAY " \
-                 f"-f Containerfile_{machine()} {repo_base_dir()}"
+    @staticmethod
+    def build_image_cmd() -> str:
+        """
+        Returns the command to build our Podman image
+        Not a plain class attribute, since it needs the graphRoot of Podman, which is only determined on first use
+
+        :return: The command to build our Podman image
+        """
+        # See: http://docs.podman.io/en/latest/markdown/podman-build.1.html
+        return f"sudo TMPDIR={podman_root()} podman build --force-rm --no-cache --pull=always --tag auv:latest " \
+               f"--build-arg UID={getuid()} --build-arg GID={getgid()} --build-arg DISPLAY=$DISPLAY " \
+               f"-f Containerfile_{machine()} {repo_base_dir()}"
 
     # See: http://docs.podman.io/en/latest/markdown/podman-run.1.html
     startContainerArgs = "sudo podman run -i -t --rm --name auv --privileged --network='host' --ipc='host' " \
@@ -260,24 +367,91 @@ class Calls:
                           "{} auv:latest".format(os_join(script_dir(), "entrypoint.sh"), "{}")
 
 
+# Used to find graphRoot in the output of `podman info` without parsing all of it, see graph_root_from_podman_info
+# Values containing escape sequences do not match, those are left to the JSON parser
+_GRAPH_ROOT_RE = re_compile(r'"graphRoot"\s*:\s*"([^"\\]*)"')
+
+
+def graph_root_from_podman_info(podman_info: str) -> str:
+    """
+    Extracts the graphRoot from the JSON output of `podman info`
+    Only falls back to parsing the whole output, if graphRoot can not be found directly
+
+    :param podman_info: The JSON output of `podman info`
+    :return:            The graphRoot of Podman
+    """
+    graph_root_match = _GRAPH_ROOT_RE.search(podman_info)
+    if graph_root_match is not None:
+        return graph_root_match.group(1).strip()
+
+    return loads(podman_info)["store"]["graphRoot"].strip()
+
+
+@lru_cache(maxsize=1)
+def podman_root() -> str:
+    """
+    Returns the graphRoot of Podman
+    The value is determined on first use and cached afterwards, so just importing this script does not call Podman
+
+    :return: The graphRoot of Podman
+    """
+    # See: http://docs.podman.io/en/latest/markdown/podman.1.html#root-value
+    # Usually calling `podman info` once suffices, only call it twice if that fails
+    completed = run_command(Calls.podmanInfoOnce, True)
+    if completed.returncode == 0:
+        try:
+            return graph_root_from_podman_info(completed.stdout)
+        except (JSONDecodeError, KeyError, TypeError):
+            pass
+
+    return graph_root_from_podman_info(run_command(Calls.podmanInfo, True, valid_return_codes=(0,)).stdout)
+
+
+# Used to find the timestamp_timeout of sudo in the output of `sudo --list` and `sudo -V`, see sudo_refresh_interval
+# See: https://www.sudo.ws/docs/man/sudoers.man/#timestamp_timeout
+_SUDO_TIMEOUT_RE = re_compile(r"(?:timestamp_timeout=|Authentication timestamp timeout: )(-?\d+(?:\.\d+)?)")
+
+
+def sudo_refresh_interval() -> float:
+    """
+    Determines how often the sudo timestamp has to be refreshed, so that sudo never asks for the password again
+    That is 80% of the shortest timestamp_timeout found in the Defaults entries matching our user and the built-in
+    defaults of sudo
+    If it can not be determined or timestamps are not cached or never expire (timestamp_timeout <= 0),
+    we refresh once a minute like before
+
+    :return: The refresh interval in seconds
+    """
+    sudo_defaults = run_command(Calls.sudoListDefaults, True).stdout
+    sudo_defaults += run_command(Calls.sudoVersionDefaults, True).stdout
+    timeouts_minutes = [float(timeout) for timeout in _SUDO_TIMEOUT_RE.findall(sudo_defaults)]
+
+    if not timeouts_minutes or min(timeouts_minutes) <= 0:
+        return 60.0
+
+    return min(timeouts_minutes) * 60 * 0.8
+
+
 def acquire_sudo():
     """
     Sudo loop since we want sudo forever
+    The sudo timestamp is refreshed by a timer rescheduling itself, instead of a thread sleeping forever
+    That only keeps sudo from asking again, as long as the timestamp_timeout does not change while we are running
     """
 
-    def _sudo_loop():
-        import time
+    def _refresh_sudo(interval: float):
+        run(["sudo", "--non-interactive", "-v"], check=False)
+        _schedule_refresh(interval)
 
-        while True:
-            run(["sudo", "--non-interactive", "-v"], check=False)
-            time.sleep(60)
+    def _schedule_refresh(interval: float):
+        timer = Timer(interval, _refresh_sudo, args=(interval,))
+        timer.daemon = True
+        timer.start()
 
     if run(["sudo", "-v"], check=False).returncode != 0:
         exit("--- EXITING - acquire sudo failed - EXITING ---")
 
-    t = Thread(target=_sudo_loop)
-    t.daemon = True
-    t.start()
+    _schedule_refresh(sudo_refresh_interval())
 
 
 def args_from_file(file: str) -> list[str]:
@@ -285,48 +459,45 @@ def args_from_file(file: str) -> list[str]:
     Reads arguments to be provided to the Podman run call from a file in the JSON format.
     The file has to contain exactly one list, containing the arguments to be provided as strings.
     Notice: If the file contains valid arguments, file will be overridden with the read arguments but formatted nicely.
+            The file is only written to, if it is not formatted nicely already.
 
     :param file:    The JSON file to read from
     :return:        The list containing the arguments read from the file
     """
-    with open(file) as f:
-        read_args = loads(f.read())
+    with open(file, "r+") as f:
+        read_content = f.read()
+        read_args = loads(read_content)
 
-    if not isinstance(read_args, list):
-        raise ValueError(f"{read_args} is not a list")
+        if not isinstance(read_args, list):
+            raise ValueError(f"{read_args} is not a list")
 
-    for argument in read_args:
-        if not isinstance(argument, str):
-            raise ValueError(f"{argument} is not a string")
+        for argument in read_args:
+            if not isinstance(argument, str):
+                raise ValueError(f"{argument} is not a string")
 
-    with open(file, "w") as f:
-        f.write(dumps(read_args, indent=4))
+        formatted_content = dumps(read_args, indent=4)
+        if formatted_content != read_content:
+            f.seek(0)
+            f.write(formatted_content)
+            f.truncate()
 
     return read_args
 
 
-def prune():
-    """
-    Calls various prune functions of Podman to clear our environment from unneeded stuff
-    """
-    run_command(Calls.pruneSystem, True, valid_return_codes=(0,))
-    run_command(Calls.pruneImage, True, valid_return_codes=(0,))
-
-
 def clear_before_building_or_after_failed_building():
     """
     Clears the Podman environment before building the image or after a failed build attempt
     """
-    run_command(Calls.rmAUVImage, True, valid_return_codes=(0, 1, 2))
-    prune()
+    invalidate_json_command_cache()
+    run_command(Calls.clearAUVImage, True, valid_return_codes=(0,))
 
 
 def clear_after_building_or_before_starting():
     """
     Clears the Podman environment after building the image or before starting a container
     """
-    run_command(Calls.rmAUVContainer, True, valid_return_codes=(0, 1, 2))
-    prune()
+    invalidate_json_command_cache()
+    run_command(Calls.clearAUVContainer, True, valid_return_codes=(0,))
 
 
 def build_image(exec_from_cmd: bool):
@@ -339,18 +510,13 @@ def build_image(exec_from_cmd: bool):
     # Ask user if building should be retried until it succeeds
     podman_question("Do you want to automatically retry building if it fails?")
     podman_note("You may stop building with CTRL+C in that case")
-    choice = "n" if exec_from_cmd else ""
-
-    while choice not in ("y", "n"):
-        choice = input(podman_input("Enter y for yes and n for no: ")).strip().lower()
-
-    retry = choice in ("y",)
+    retry = not exec_from_cmd and input_yes_or_no() == "y"
 
     # Actually start building the image
     try:
         clear_before_building_or_after_failed_building()
         while True:
-            if run_command(Calls.buildImage).returncode != 0:
+            if run_command(Calls.build_image_cmd()).returncode != 0:
                 clear_before_building_or_after_failed_building()
 
                 podman_error(
@@ -398,6 +564,7 @@ def start_container(exec_from_cmd: bool):
     Starts a Podman container
     """
     run_command(Calls.startContainerArgs.format(prepare_starting()))
+    invalidate_json_command_cache()
 
 
 def save_image(exec_from_cmd: bool):
@@ -415,15 +582,10 @@ def save_image(exec_from_cmd: bool):
         )).strip(), "auv_latest.tar"))
 
     podman_question(f"Do you want to save the image auv:latest to {path_to_save} ?")
-    choice = "y" if exec_from_cmd else ""
-
-    while choice not in ("y", "n"):
-        choice = input(podman_input("Enter y for yes and n for no: ")).strip().lower()
-
-    if choice in ("n",):
+    if not exec_from_cmd and input_yes_or_no() == "n":
         return
 
-    if run_command(Calls.saveImageArgs.format(shlex_quote(path_to_save))).returncode == 0:
+    if run_command(format_command(Calls.saveImageArgs, path_to_save)).returncode == 0:
         run_command(f"sudo chown $USER:$USER {shlex_quote(path_to_save)}", True)
         podman_note(f"SUCCESS: Image auv:latest was successfully saved to {path_to_save}", new_line=True)
     else:
@@ -447,7 +609,7 @@ def load_image(exec_from_cmd: bool):
         )).strip())
 
     clear_before_building_or_after_failed_building()
-    if run_command(Calls.loadImageArgs.format(shlex_quote(path_to_load))).returncode == 0:
+    if run_command(format_command(Calls.loadImageArgs, path_to_load)).returncode == 0:
         clear_after_building_or_before_starting()
         podman_note(f"SUCCESS: Image loaded successfully from {path_to_load}", new_line=True)
     else:
@@ -457,40 +619,122 @@ def load_image(exec_from_cmd: bool):
         raise RuntimeError
 
 
-def print_debug_info(exec_from_cmd: bool):
+# Pretty-printed JSON outputs of commands with the time they were created at, see pretty_json_of_command
+_json_command_cache: dict[str | Sequence[str], tuple[float, str]] = {}
+# Long enough to cover going back to the menu and choosing Debug again, every change we make invalidates it explicitly
+_JSON_COMMAND_CACHE_SECONDS = 60.0
+
+
+def pretty_json_of_command(command: str | Sequence[str]) -> str:
     """
-    Prints debug information about Podman and the version of the Python helper itself
+    Runs a command that outputs JSON and returns the output pretty-printed
+    The result is cached for a minute, call invalidate_json_command_cache() after changing the Podman environment
+
+    :param command: The command to run, see run_command
+    :return:        The pretty-printed JSON output of the command
+    """
+    now = monotonic()
+    cached = _json_command_cache.get(command)
+    if cached is not None and now - cached[0] < _JSON_COMMAND_CACHE_SECONDS:
+        return cached[1]
+
+    pretty_json = dumps(loads(run_command(command, True).stdout), indent=4)
+    _json_command_cache[command] = (now, pretty_json)
+
+    return pretty_json
+
+
+def invalidate_json_command_cache():
+    """
+    Invalidates the cached outputs of pretty_json_of_command()
+    """
+    _json_command_cache.clear()
+
+
+# Contents of files with their modification time, see read_file_cached
+_file_cache: dict[str, tuple[int, str]] = {}
+
+
+def read_file_cached(file: str) -> str:
+    """
+    Reads a file, but only if it changed since the last time it was read by this function
+
+    :param file:    The file to read
+    :return:        The content of the file
+    """
+    modification_time = stat(file).st_mtime_ns
+    cached = _file_cache.get(file)
+    if cached is not None and cached[0] == modification_time:
+        return cached[1]
+
+    with open(file) as f:
+        content = f.read()
+    _file_cache[file] = (modification_time, content)
+
+    return content
+
+
+# Used to turn the output of `git describe` into a version string, see helper_version
+_GIT_DESCRIBE_RE = re_compile(r"([^-]*-g)")
+
+
+def helper_version() -> str:
+    """
+    Returns the version of the Python helper, determined via git
+
+    :return: The version of the Python helper, or an empty string if it could not be determined
     """
     # See: https://wiki.archlinux.org/index.php/VCS_package_guidelines#Git
-    podman_status("The version of the Python helper  is: {}".format(
-        run(
-            r"""git describe --long --tags --abbrev=7 | sed 's/\([^-]*-g\)/r\1/;s/-/./g'""",
+    # Same as `git describe --long --tags --abbrev=7 | sed 's/\([^-]*-g\)/r\1/;s/-/./g'` but without shell and sed
+    try:
+        git_description = run(
+            ["git", "describe", "--long", "--tags", "--abbrev=7"],
             cwd=repo_base_dir(),
-            shell=True, text=True, capture_output=True, check=False,
-        ).stdout.strip(),
-    ), new_line=True)
+            text=True, capture_output=True, check=False,
+        ).stdout.strip()
+    except OSError:
+        git_description = ""
 
-    podman_status(
-        "The currently used Podman info    is:\n{}".format(
-            dumps(loads(run_command(Calls.podmanInfo, True).stdout.strip()), indent=4),
-        ),
-    )
+    return _GIT_DESCRIBE_RE.sub(r"r\1", git_description, count=1).replace("-", ".")
 
-    with open(os_join(script_dir(), "args.json")) as args_json:
-        podman_status(
-            f"The currently used args.json:\n{args_json.read().strip()}",
-        )
 
-    with open(os_join(script_dir(), "entrypoint.sh")) as entrypoint_sh:
-        podman_status(
-            f"The currently used entrypoint.sh:\n{entrypoint_sh.read().strip()}",
-        )
+def mount_info() -> str:
+    """
+    Returns the pretty-printed mount info for the graphRoot of Podman
 
-    podman_status(
-        "Mount info for graphRoot:\n{}".format(
-            dumps(loads(run_command(Calls.mountInfoArgs.format(Calls.podmanRoot), True).stdout.strip()), indent=4),
-        ),
-    )
+    :return: The pretty-printed mount info for the graphRoot of Podman
+    """
+    return pretty_json_of_command(format_command(Calls.mountInfoArgs, podman_root()))
+
+
+def print_debug_info(exec_from_cmd: bool):
+    """
+    Prints debug information about Podman and the version of the Python helper itself
+    """
+
+    def _mount_info_after_podman_info() -> str:
+        # Calls.podmanInfo has to run before podman_root() calls `podman info` again, see Calls.podmanInfo
+        # That also keeps the calls of sudo in order, so at most one of them asks for the password
+        podman_info.result()
+        return mount_info()
+
+    # Gather everything concurrently, since most of it waits for subprocesses, but print it in order
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        version = executor.submit(helper_version)
+        podman_info = executor.submit(pretty_json_of_command, Calls.podmanInfo)
+        args_json = executor.submit(read_file_cached, os_join(script_dir(), "args.json"))
+        entrypoint_sh = executor.submit(read_file_cached, os_join(script_dir(), "entrypoint.sh"))
+        graph_root_mount_info = executor.submit(_mount_info_after_podman_info)
+
+    podman_status(f"The version of the Python helper  is: {version.result()}", new_line=True)
+
+    podman_status(f"The currently used Podman info    is:\n{podman_info.result()}")
+
+    podman_status(f"The currently used args.json:\n{args_json.result().strip()}")
+
+    podman_status(f"The currently used entrypoint.sh:\n{entrypoint_sh.result().strip()}")
+
+    podman_status(f"Mount info for graphRoot:\n{graph_root_mount_info.result()}")
 
     if not exec_from_cmd:
         print_and_input(
@@ -504,7 +748,7 @@ def systemd_started() -> bool:
 
     :return: Whether the systemd service is currently started
     """
-    return run_command(Calls.systemdStarted, True).returncode == 0
+    return run_command(Calls.systemdStarted, discard_output=True).returncode == 0
 
 
 def container_running() -> bool:
@@ -513,7 +757,26 @@ def container_running() -> bool:
 
     :return: Whether the container is currently running
     """
-    return run_command(Calls.containerRunning, True).returncode == 0
+    return run_command(Calls.containerRunning, discard_output=True).returncode == 0
+
+
+def query_status() -> tuple[bool, bool]:
+    """
+    Checks whether the systemd service is currently started and whether the container is currently running
+    Both checks are done with a single call instead of calling systemd_started() and container_running()
+
+    :return: Whether the systemd service is currently started and whether the container is currently running
+    """
+    try:
+        # Only the last two lines hold the return codes, messages like sudo warnings may come before them
+        systemd_return_code, container_return_code = (
+            int(line) for line in run_probe(Calls.combinedStatus).stdout.splitlines()[-2:]
+        )
+    except ValueError:
+        # Fall back to the single checks if the output is not what we expect, e.g. because sudo failed
+        return systemd_started(), container_running()
+
+    return systemd_return_code == 0, container_return_code == 0
 
 
 def systemd_disable(exec_from_cmd: bool):
@@ -527,6 +790,7 @@ def systemd_stop():
     """
     Stops the systemd service of the container
     """
+    invalidate_json_command_cache()
     run_command(Calls.systemdStop, True, valid_return_codes=(0,))
 
 
@@ -580,8 +844,9 @@ def podman_reset(exec_from_cmd: bool):
     """
     Resets the Podman environment completely
     """
+    invalidate_json_command_cache()
     try:
-        run_command(f"sudo rm -rf {shlex_quote(Calls.podmanRoot)}", True, valid_return_codes=(0,))
+        run_command(("sudo", "rm", "-rf", podman_root()), True, valid_return_codes=(0,))
         run_command(Calls.podmanReset, True, valid_return_codes=(0,))
     except RuntimeError:
         podman_error("Could not reset the Podman environment, look at the output to find the problem", new_line=True)
@@ -609,12 +874,17 @@ def stop_systemd_service_or_container(is_systemd_service: bool):
         "Can the Python helper stop it now?",
         new_line=True,
     )
-    user_choice = ""
-
-    while user_choice not in ("y", "n"):
-        user_choice = input(podman_input("Enter y for yes and n for no: ")).strip().lower()
+    # Ask once more at most instead of looping, and not at all if the answer does not come from a terminal
+    # Everything but yes, including the end of the input, means no
+    try:
+        user_choice = input_yes_or_no(
+            max_attempts=2 if stdin.isatty() else 1,
+            last_prompt="Enter y for yes, anything else means no: ",
+        )
+    except EOFError:
+        user_choice = "n"
 
-    if user_choice == "n":
+    if user_choice != "y":
         exit()
 
     if is_systemd_service:
@@ -633,6 +903,124 @@ def stop_systemd_service_or_container(is_systemd_service: bool):
     )
 
 
+# The execution possibilities for the user: the name, the description lines and the function to execute
+# The names of the functions are also the valid command line arguments, see the README
+EXECUTION_POSSIBILITIES = (
+    ("Build", [
+        "Builds a new image from the Containerfile_x86_64 in the base directory of this project",
+        "VERY IMPORTANT: During building of the image, the UID and GID of the user executing this script",
+        "are used to set the UID and GID of the pod user inside the image",
+        "That makes working with files and folders you mount into the container via 'args.json' easier",
+        "since you do not have to use chown on those files and folders, to get permissions right",
+        "ALSO IMPORTANT: The DISPLAY environment variable that is set while executing the Python helper will be",
+        "written into '/etc/profile.d/display.sh' inside the container",
+        "The 'display.sh' is e. g. used in the 'entrypoint.sh' and is in general used to allow displaying",
+        "of graphical programs on the host system without using 'x2go'",
+        "Keep those two things in mind, when exporting and importing images with the Python helper",
+        "If you have already built or imported an image, that images gets deleted first - automatically",
+    ], build_image),
+
+    ("Load", [
+        "Loads an already built image from a .tar archive",
+        "If you have already built or imported an image, that images gets deleted first - automatically",
+    ], load_image),
+
+    ("Start", [
+        "Starts a container based on the image currently present on this system",
+        "If you did not build or import an image before trying to start a container, the starting will fail",
+    ], start_container),
+
+    ("Save", [
+        "Saves the image that is currently present on this system to a .tar archive",
+        "If you did not build or import an image before trying to export the image, the exporting will fail",
+    ], save_image),
+
+    ("Create and install systemd service file", [
+        f"The created systemd service file will be installed to '{Calls.serviceFilePath}'",
+        "It will not be started or enabled via 'systemctl', it will just be copied to the mentioned location",
+        "Use other options of this Python helper to start and enable the service",
+        "You need to re-run this option after changing the 'args.json' to include the changes in the service file",
+        "You also need to re-run this option after moving the folder containing this project to another location",
+        "If you did not build or import an image before trying to create the service file, the creating will fail",
+    ], systemd_create),
+
+    ("Start via systemd", [
+        "Starts a container based on the image currently present on this system",
+        f"Starting is done via '{command_as_str(Calls.systemdStart)}'",
+        "After starting the container via systemd, the Python helper will exit",
+        "The started container runs in the background and may be stopped when re-opening the Python helper",
+        "You may connect to the started container with 'ssh' or 'x2go'",
+        "If you did not create and install a systemd service file first, the starting will fail",
+    ], systemd_start),
+
+    ("Automatic start at boot and automatic restart via systemd", [
+        "Enables the automatic starting of a container at boot",
+        "Also enables automatic restarting of that container",
+        "Automatic restarting happens in every case, which means regular shutdowns and crashes",
+        f"Enabling is done via '{command_as_str(Calls.systemdEnable)}'",
+        "This does not start a container via systemd",
+        "To start a container via systemd, reboot the system after enabling this option",
+        "Or use the regarding option of the Python helper to start a container via systemd without rebooting",
+        "If you did not create and install a systemd service file first, the enabling will fail",
+    ], systemd_enable),
+
+    ("Disable automatic start at boot and disable automatic restart via systemd", [
+        "Just reverts the 'Automatic start at boot and automatic restart via systemd' option of the Python helper",
+        f"Disabling is done via '{command_as_str(Calls.systemdDisable)}'",
+        "If you did not create and install a systemd service file first, the disabling will fail",
+    ], systemd_disable),
+
+    ("Enable Xhost", [
+        "If you want to run graphical programs inside the Podman container and see them on your normal host system",
+        "without using 'x2go', you need to grant the container access to your local X server",
+        "This option does that, and repeats it automatically every time you login with any user on the host system",
+        f"That is achieved by placing a shell script in '{Calls.xhostFilePath}'",
+        "NOTICE: You need to have 'xhost' installed on your host system to use that feature",
+        "You may check that via executing the 'xhost' command in a terminal to see if the command exists",
+    ], xhost_enable_start),
+
+    ("Disable Xhost", [
+        "Just reverts the 'Enable Xhost' option of the Python helper",
+    ], xhost_disable_stop),
+
+    ("Debug", [
+        "Prints debug information including the version of the Python helper",
+        "Include this information in every Issue or Pull Request you open on GitHub",
+    ], print_debug_info),
+
+    ("Reset Podman environment", [
+        "Completely resets the Podman environment",
+        "That means: All pods, all images, all containers and all volumes",
+    ], podman_reset),
+
+    ("Exit", [
+        "Exits the Python helper",
+    ], exit_python_helper),
+)
+
+# Maps function names to functions of the execution possibilities, used for the command line arguments
+_NAME_TO_F = {f.__name__: f for _, _, f in EXECUTION_POSSIBILITIES}
+
+
+@lru_cache(maxsize=1)
+def render_menu() -> str:
+    """
+    Renders the menu, which lets the user choose one of the execution possibilities
+    The menu never changes, so it is rendered once and cached afterwards
+
+    :return: The whole menu as a single string to be printed at once
+    """
+    menu_lines = [podman_status("Choose, what you want to do next", new_line=True, to_print=False)]
+
+    for i, (name, description_lines, _) in enumerate(EXECUTION_POSSIBILITIES, start=1):
+        menu_lines.append(
+            podman_note(f"Enter {Colors.cyan(Colors.bold(i))} for: {Colors.cyan(name)}", new_line=True, to_print=False),
+        )
+        menu_lines.extend(podman_status(description_line, to_print=False) for description_line in description_lines)
+
+    return "\n".join(menu_lines)
+
+
 if __name__ == "__main__":
     """
     Entry point for the program
@@ -640,158 +1028,62 @@ if __name__ == "__main__":
     # We want sudo priv
     acquire_sudo()
 
-    # Set the execution possibilities for the user
-    execution_possibilities = [
-        ("Build", [
-            "Builds a new image from the Containerfile_x86_64 in the base directory of this project",
-            "VERY IMPORTANT: During building of the image, the UID and GID of the user executing this script",
-            "are used to set the UID and GID of the pod user inside the image",
-            "That makes working with files and folders you mount into the container via 'args.json' easier",
-            "since you do not have to use chown on those files and folders, to get permissions right",
-            "ALSO IMPORTANT: The DISPLAY environment variable that is set while executing the Python helper will be",
-            "written into '/etc/profile.d/display.sh' inside the container",
-            "The 'display.sh' is e. g. used in the 'entrypoint.sh' and is in general used to allow displaying",
-            "of graphical programs on the host system without using 'x2go'",
-            "Keep those two things in mind, when exporting and importing images with the Python helper",
-            "If you have already built or imported an image, that images gets deleted first - automatically",
-        ], build_image),
-
-        ("Load", [
-            "Loads an already built image from a .tar archive",
-            "If you have already built or imported an image, that images gets deleted first - automatically",
-        ], load_image),
-
-        ("Start", [
-            "Starts a container based on the image currently present on this system",
-            "If you did not build or import an image before trying to start a container, the starting will fail",
-        ], start_container),
-
-        ("Save", [
-            "Saves the image that is currently present on this system to a .tar archive",
-            "If you did not build or import an image before trying to export the image, the exporting will fail",
-        ], save_image),
-
-        ("Create and install systemd service file", [
-            f"The created systemd service file will be installed to '{Calls.serviceFilePath}'",
-            "It will not be started or enabled via 'systemctl', it will just be copied to the mentioned location",
-            "Use other options of this Python helper to start and enable the service",
-            "You need to re-run this option after changing the 'args.json' to include the changes in the service file",
-            "You also need to re-run this option after moving the folder containing this project to another location",
-            "If you did not build or import an image before trying to create the service file, the creating will fail",
-        ], systemd_create),
-
-        ("Start via systemd", [
-            "Starts a container based on the image currently present on this system",
-            f"Starting is done via '{Calls.systemdStart}'",
-            "After starting the container via systemd, the Python helper will exit",
-            "The started container runs in the background and may be stopped when re-opening the Python helper",
-            "You may connect to the started container with 'ssh' or 'x2go'",
-            "If you did not create and install a systemd service file first, the starting will fail",
-        ], systemd_start),
-
-        ("Automatic start at boot and automatic restart via systemd", [
-            "Enables the automatic starting of a container at boot",
-            "Also enables automatic restarting of that container",
-            "Automatic restarting happens in every case, which means regular shutdowns and crashes",
-            f"Enabling is done via '{Calls.systemdEnable}'",
-            "This does not start a container via systemd",
-            "To start a container via systemd, reboot the system after enabling this option",
-            "Or use the regarding option of the Python helper to start a container via systemd without rebooting",
-            "If you did not create and install a systemd service file first, the enabling will fail",
-        ], systemd_enable),
-
-        ("Disable automatic start at boot and disable automatic restart via systemd", [
-            "Just reverts the 'Automatic start at boot and automatic restart via systemd' option of the Python helper",
-            f"Disabling is done via '{Calls.systemdDisable}'",
-            "If you did not create and install a systemd service file first, the disabling will fail",
-        ], systemd_disable),
-
-        ("Enable Xhost", [
-            "If you want to run graphical programs inside the Podman container and see them on your normal host system",
-            "without using 'x2go', you need to grant the container access to your local X server",
-            "This option does that, and repeats it automatically every time you login with any user on the host system",
-            f"That is achieved by placing a shell script in '{Calls.xhostFilePath}'",
-            "NOTICE: You need to have 'xhost' installed on your host system to use that feature",
-            "You may check that via executing the 'xhost' command in a terminal to see if the command exists",
-        ], xhost_enable_start),
-
-        ("Disable Xhost", [
-            "Just reverts the 'Enable Xhost' option of the Python helper",
-        ], xhost_disable_stop),
-
-        ("Debug", [
-            "Prints debug information including the version of the Python helper",
-            "Include this information in every Issue or Pull Request you open on GitHub",
-        ], print_debug_info),
-
-        ("Reset Podman environment", [
-            "Completely resets the Podman environment",
-            "That means: All pods, all images, all containers and all volumes",
-        ], podman_reset),
-
-        ("Exit", [
-            "Exits the Python helper",
-        ], exit_python_helper),
-    ]
-
-    # Create a dictionary mapping function names to functions of the execution possibilities
-    name_to_f = {f.__name__: f for f in [f for _, _, f in execution_possibilities]}
-
     # The function names of the functions to execute given via command line arguments
     f_names_from_cmd = argv[1:]
 
     # Check that all function names from the command line are valid
-    are_all_f_names_from_cmd_valid = True
-    for f_name in f_names_from_cmd:
-        if f_name not in name_to_f:
-            podman_error(f"Invalid function name {f_name} given via command line argument", new_line=False)
-            are_all_f_names_from_cmd_valid = False
+    invalid_f_names_from_cmd = [f_name for f_name in f_names_from_cmd if f_name not in _NAME_TO_F]
+    for f_name in invalid_f_names_from_cmd:
+        podman_error(f"Invalid function name {f_name} given via command line argument", new_line=False)
+    are_all_f_names_from_cmd_valid = not invalid_f_names_from_cmd
 
     # If all function names are valid, make sure the container isn't running and execute the functions in order
     if are_all_f_names_from_cmd_valid and len(f_names_from_cmd) > 0:
+        # Both checks are done with a single call, a failed check means not started or not running
+        is_systemd_started, is_container_running = query_status()
         # If the container is started via systemd, stop it
-        if systemd_started():
+        if is_systemd_started:
             systemd_stop()
         # If the container is running, stop it
-        if container_running():
+        if is_container_running:
             clear_after_building_or_before_starting()
         # Execute the functions in order
         for f_name in f_names_from_cmd:
-            name_to_f[f_name](exec_from_cmd=True)
+            _NAME_TO_F[f_name](exec_from_cmd=True)
     # If not all function names are valid, print the valid function names and exit
     elif not are_all_f_names_from_cmd_valid:
         raise RuntimeError("Invalid function name(s) in command line argument(s), valid function names are: {}".format(
-            ", ".join(name_to_f.keys()),
+            ", ".join(_NAME_TO_F.keys()),
         ))
 
     # Let the user execute things until he decides to exit the program
+    execution_possibilities_count = len(EXECUTION_POSSIBILITIES)
+    # Longer choices can not be valid, and int() refuses to convert too many digits
+    max_choice_length = len(str(execution_possibilities_count))
     while True:
+        is_systemd_started, is_container_running = query_status()
+
         # Let the user only use the Python helper if the systemd service is not started
-        if systemd_started():
+        if is_systemd_started:
             stop_systemd_service_or_container(is_systemd_service=True)
             continue
 
         # Let the user only use the Python helper if the container is not running
-        if container_running():
+        if is_container_running:
             stop_systemd_service_or_container(is_systemd_service=False)
             continue
 
         # Let the user execute a thing
-        podman_status("Choose, what you want to do next", new_line=True)
-        for i in range(0, len(execution_possibilities)):
-            podman_note(
-                f"Enter {Colors.cyan(Colors.bold(i + 1))} for: {Colors.cyan(execution_possibilities[i][0])}",
-                new_line=True,
-            )
-            for description_line in execution_possibilities[i][1]:
-                podman_status(description_line)
+        print(render_menu())
         try:
-            user_choice = int(input(podman_input("Enter your choice: ", new_line=True)))
-            if 1 <= user_choice <= len(execution_possibilities):
-                execution_possibilities[user_choice - 1][2](exec_from_cmd=False)
+            user_choice = input(podman_input("Enter your choice: ", new_line=True)).strip()
+            if (user_choice.isdecimal() and len(user_choice) <= max_choice_length
+                    and 1 <= int(user_choice) <= execution_possibilities_count):
+                EXECUTION_POSSIBILITIES[int(user_choice) - 1][2](exec_from_cmd=False)
             else:
-                raise IndexError
-        except (ValueError, IndexError):
+                podman_error("That choice was not valid")
+        except ValueError:
+            # Like before, a ValueError of the chosen thing (e.g. a JSONDecodeError in Debug) does not end the helper
             podman_error("That choice was not valid")
         except EOFError:
             podman_error("We caught an EOFError, which is not your fault, just restart the script", new_line=True)